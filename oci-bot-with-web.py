@@ -10,20 +10,35 @@ import time
 import sys
 import os
 import telebot
+import requests
 import datetime
 import configparser
 import json
 import threading
+import queue
 import secrets
 import hashlib
+import hmac
+import random
+import gzip
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Tuple
 from functools import wraps
+from collections import deque, Counter
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Log formats never use thread/process details, so skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 
 # Flask imports - optional
 try:
-    from flask import Flask, render_template_string, jsonify, request, redirect, url_for, session
+    from flask import Flask, Response, jsonify, request, redirect, url_for
     from flask_cors import CORS
     FLASK_AVAILABLE = True
 except ImportError:
@@ -31,14 +46,76 @@ except ImportError:
     print("Warning: Flask not installed. Web dashboard disabled.")
     print("Install with: pip install flask flask-cors")
 
+# Response caching - optional
+try:
+    from flask_caching import Cache
+    CACHING_AVAILABLE = True
+except ImportError:
+    CACHING_AVAILABLE = False
+
+# Password hashing - optional
+try:
+    import bcrypt
+    BCRYPT_AVAILABLE = True
+except ImportError:
+    BCRYPT_AVAILABLE = False
+
+# Fast JSON encoding - optional
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    # Counter/dict keys are not always strings; stdlib json coerces them, orjson needs this flag
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Production WSGI servers - optional
+try:
+    from waitress import serve as waitress_serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
+try:
+    from gevent.pywsgi import WSGIServer
+    GEVENT_AVAILABLE = True
+except ImportError:
+    GEVENT_AVAILABLE = False
+
 # Constants
 CONFIG_FILE = 'configuration.ini'
 LOG_FILE = 'oci_occ.log'
 MAX_LOG_SIZE = 5 * 1024 * 1024  # 5 MB
 LOG_BACKUP_COUNT = 3
+TOO_MANY_REQUESTS_MULTIPLIER = 4  # Extra backoff while OCI is throttling us
+MAX_BACKOFF_EXPONENT = 32
+AD_COOLDOWN_MAX = 60  # Upper bound in seconds for skipping an AD that keeps reporting no capacity
+CAPACITY_ERRORS = frozenset({'OutOfHostCapacity', 'OutOfCapacity', 'OutOfBareMetalCapacity'})
+INSTANCE_COUNT_CACHE_TTL = 30  # Seconds a running-instance count is reused
+SWEEP_TIMEOUT_FLOOR = 30  # Minimum seconds to wait for one sweep over all ADs
+OCI_TIMEOUT = (5, 30)  # (connect, read) seconds for OCI API calls
+OCI_POOL_CONNECTIONS = 4
+OCI_POOL_MAXSIZE = 8  # Keep-alive connections per OCI endpoint
+TELEGRAM_POOL_SIZE = 4
+TELEGRAM_EDIT_INTERVAL = 5  # Minimum seconds between status message edits
+LOG_ROLLOVER_CHECK_INTERVAL = 64  # Records between log file size checks
+DASHBOARD_SESSION_COOKIE = 'oci_dashboard_token'
+DASHBOARD_SESSION_TTL = 12 * 3600  # Seconds a dashboard login stays valid
+DASHBOARD_STREAM_KEEPALIVE = 15  # Seconds between SSE keep-alive comments
+DASHBOARD_STREAM_RESERVED_THREADS = 2  # Server threads kept free of SSE streams for API/page requests
+DASHBOARD_LOG_LIMIT = 200  # Log entries kept in memory (same cap as the old list trim)
+DASHBOARD_LOG_PAGE = 50  # Log entries returned by /api/status
+INSTANCE_HISTORY_LIMIT = 100
+DASHBOARD_ERROR_TYPES = 10  # Most common error codes returned by /api/status
+ERROR_TYPES_LIMIT = 64  # Distinct error codes tracked before the rarest are dropped
+ERROR_TYPES_KEEP = 32  # Most common error codes kept when the limit is hit
+# OCI SDK releases affected by the Expect: 100-continue handshake delay
+EXPECT_HEADER_AFFECTED_VERSIONS = ((2, 38, 4), (2, 43, 0))
 
 # Global variables for web dashboard
 app = None
+# Guards dashboard_data: the bot, AD workers and Flask threads all touch it
+dashboard_lock = threading.Lock()
 dashboard_data = {
     'bot_status': 'stopped',
     'start_time': None,
@@ -47,11 +124,11 @@ dashboard_data = {
     'last_error': None,
     'current_ad': None,
     'retry_interval': 0,
-    'instances_created': [],
-    'logs': [],
+    'instances_created': deque(maxlen=INSTANCE_HISTORY_LIMIT),
+    'logs': deque(maxlen=DASHBOARD_LOG_LIMIT),
     'statistics': {
-        'success_rate': 0,
-        'errors_by_type': {}
+        'successes': 0,
+        'errors_by_type': Counter()
     }
 }
 
@@ -63,8 +140,7 @@ DASHBOARD_HTML = '''
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>OCI Bot Dashboard</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
+    <link href="/static/app.css" rel="stylesheet">
     <style>
         body {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -390,6 +466,10 @@ DASHBOARD_HTML = '''
         async function loadConfig() {
             try {
                 const response = await fetch('/api/config');
+                if (response.status === 401) {
+                    window.location.href = '/login';
+                    return;
+                }
                 const config = await response.json();
                 
                 document.getElementById('config-shape').textContent = config.machine.shape || '-';
@@ -405,6 +485,10 @@ DASHBOARD_HTML = '''
         async function refreshData() {
             try {
                 const response = await fetch('/api/status');
+                if (response.status === 401) {
+                    window.location.href = '/login';
+                    return;
+                }
                 const data = await response.json();
                 updateUI(data);
             } catch (error) {
@@ -523,13 +607,36 @@ DASHBOARD_HTML = '''
             }
         }
         
+        // Fall back to polling every 2 seconds (matches the server-side status cache)
+        function startPolling() {
+            if (refreshInterval === null) {
+                refreshData();
+                refreshInterval = setInterval(refreshData, 2000);
+            }
+        }
+        
+        // Receive status updates pushed by the server
+        function startStream() {
+            if (!window.EventSource) {
+                startPolling();
+                return;
+            }
+            const source = new EventSource('/api/stream');
+            source.onmessage = function(event) {
+                updateUI(JSON.parse(event.data));
+            };
+            source.onerror = function() {
+                // CLOSED means the server refused the stream; otherwise the browser reconnects
+                if (source.readyState === EventSource.CLOSED) {
+                    startPolling();
+                }
+            };
+        }
+        
         // Initialize
         document.addEventListener('DOMContentLoaded', function() {
             loadConfig();
-            refreshData();
-            
-            // Auto-refresh every 5 seconds
-            refreshInterval = setInterval(refreshData, 5000);
+            startStream();
         });
     </script>
 </body>
@@ -543,8 +650,7 @@ LOGIN_HTML = '''
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>OCI Bot Dashboard - Login</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
+    <link href="/static/app.css" rel="stylesheet">
     <style>
         body {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -629,7 +735,171 @@ LOGIN_HTML = '''
 </html>
 '''
 
+# Self-hosted stylesheet (Bootstrap subset + icon glyphs). The URL carries a
+# content hash so browsers can cache it forever and still pick up new versions.
+try:
+    APP_CSS = (Path(__file__).resolve().parent / 'static' / 'app.css').read_bytes()
+except OSError:
+    APP_CSS = b''
+    print("Warning: static/app.css not found. Dashboard will be unstyled.")
+APP_CSS_GZ = gzip.compress(APP_CSS, 9)
+APP_CSS_ETAG = hashlib.md5(APP_CSS).hexdigest()
+APP_CSS_URL = f"/static/app.css?v={APP_CSS_ETAG[:12]}"
+STATIC_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+DASHBOARD_HTML = DASHBOARD_HTML.replace('/static/app.css', APP_CSS_URL)
+LOGIN_HTML = LOGIN_HTML.replace('/static/app.css', APP_CSS_URL)
+
+# The dashboard page is static markup: compress it once and serve it with an ETag
+DASHBOARD_BODY = DASHBOARD_HTML.encode('utf-8')
+DASHBOARD_GZ = gzip.compress(DASHBOARD_BODY, 9)
+DASHBOARD_ETAG = hashlib.md5(DASHBOARD_BODY).hexdigest()
+DASHBOARD_CACHE_CONTROL = 'private, max-age=300'
+
+# Telegram message templates, filled in with str.format_map
+TG_STATUS_TEMPLATE = """📊 <b>Statistics:</b>
+• Total Attempts: {total_attempts}
+• Current AD: {current_ad}
+• Retry Interval: {retry_interval:.1f}s
+• Uptime: {hours}h {minutes}m
+
+🔄 <b>Last Error:</b> {last_error}
+✅ <b>Instances Created:</b> {instances_created}
+"""
+
+TG_SUCCESS_TEMPLATE = """
+🎉 <b>SUCCESS!</b> 🎉
+
+✅ Instance created successfully!
+
+📋 <b>Details:</b>
+{instances}
+• Shape: {shape}
+• Display Name: {display_name}
+• Total Attempts: {total_attempts}
+
+⏱ Time taken: {elapsed}
+{extra_note}"""
+
+TG_EXTRA_INSTANCES_NOTE = """
+⚠️ Concurrent attempts created {count} instances. Terminate the ones you do not need.
+"""
+
+TG_CRITICAL_TEMPLATE = """
+⚠️ <b>Critical Error!</b>
+
+❌ Error Code: {code}
+📝 Message: {message}
+
+🔧 Bot may need configuration check!
+"""
+
+TG_STARTUP_TEMPLATE = """
+🚀 <b>Bot Started!</b>
+
+⚙️ <b>Configuration:</b>
+• Region: {region}
+• Shape: {shape}
+• Type: {machine_type}
+• OCPUs: {ocpus}
+• Memory: {memory} GB
+• Display Name: {display_name}
+
+📍 <b>Availability Domains:</b>
+{availability_domains}
+
+⏰ Started at: {started_at}
+"""
+
+TG_STOPPED_TEMPLATE = """
+🛑 <b>Bot Stopped</b>
+
+📊 Final Statistics:
+• Total Attempts: {total_attempts}
+• Instances Created: {instances_created}
+• Runtime: {runtime}
+"""
+
+
+def fast_dumps(obj) -> str:
+    """Encode obj as a JSON string, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode('utf-8')
+    return json.dumps(obj)
+
+
+def fast_jsonify(obj):
+    """jsonify() replacement that encodes with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return Response(orjson.dumps(obj, option=ORJSON_OPTIONS), mimetype='application/json')
+    return jsonify(obj)
+
+
+def dashboard_snapshot() -> Dict[str, Any]:
+    """JSON-ready copy of dashboard_data with only the newest log entries"""
+    with dashboard_lock:
+        logs = dashboard_data['logs']
+        status = dict(dashboard_data)
+        status['logs'] = list(islice(logs, max(0, len(logs) - DASHBOARD_LOG_PAGE), len(logs)))
+        status['instances_created'] = list(dashboard_data['instances_created'])
+        
+        statistics = dashboard_data['statistics']
+        total_attempts = dashboard_data['total_attempts']
+        status['statistics'] = {
+            'success_rate': statistics['successes'] / total_attempts * 100 if total_attempts else 0,
+            'errors_by_type': dict(statistics['errors_by_type'].most_common(DASHBOARD_ERROR_TYPES))
+        }
+    return status
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders asctime once per second instead of once per record"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._time_cache = (None, '')
+    
+    def formatTime(self, record, datefmt=None) -> str:
+        if not datefmt:
+            # Default format includes milliseconds, which can't be cached per second
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, cached_text = self._time_cache
+        if cached_second == second:
+            return cached_text
+        text = time.strftime(datefmt, self.converter(record.created))
+        self._time_cache = (second, text)
+        return text
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that only checks the file size every few records"""
+    
+    def __init__(self, *args, check_interval: int = LOG_ROLLOVER_CHECK_INTERVAL, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.check_interval = check_interval
+        self._records_since_check = 0
+    
+    def shouldRollover(self, record) -> bool:
+        self._records_since_check += 1
+        if self._records_since_check < self.check_interval:
+            return False
+        self._records_since_check = 0
+        return super().shouldRollover(record)
+
+
 class OciOccFix:
+    # Service error code -> (log level, log message, dashboard level, dashboard message, notify Telegram)
+    ERROR_HANDLERS = {
+        'OutOfHostCapacity': (logging.DEBUG, "Out of capacity in {ad}", 'INFO', "Out of capacity in {ad}", False),
+        'OutOfCapacity': (logging.DEBUG, "Out of capacity in {ad}", 'INFO', "Out of capacity in {ad}", False),
+        'OutOfBareMetalCapacity': (logging.DEBUG, "Out of capacity in {ad}", 'INFO', "Out of capacity in {ad}", False),
+        'InternalError': (logging.WARNING, "Internal error in {ad}", 'WARNING', "Internal error (not capacity related)", False),
+        'TooManyRequests': (logging.WARNING, "Too many requests - slowing down", 'WARNING', "Too many requests - slowing down", False),
+        'LimitExceeded': (logging.ERROR, "Limit exceeded: {message}", 'ERROR', "Limit exceeded - check your quotas", True),
+        'InvalidParameter': (logging.ERROR, "Invalid parameter: {message}", 'ERROR', "Invalid parameter in request", True),
+    }
+    DEFAULT_ERROR_HANDLER = (logging.WARNING, "Service error in {ad}: {code} - {message}", 'WARNING', "Service error: {code}", False)
+    
     def __init__(self):
         """Initialize OCI OCC Fix bot with proper configuration"""
         try:
@@ -637,55 +907,72 @@ class OciOccFix:
             self.config = self.load_config()
             self.setup_logging()
             
-            # Phase 2: Initialize critical parameters
-            try:
-                self.wait_seconds = float(self.config.get('Retry', 'initial_retry_interval'))
-            except:
-                self.wait_seconds = 1.0
+            # Phase 2: Initialize critical parameters (read once, never on hot paths)
+            self.initial_wait = self._cfg('Retry', 'initial_retry_interval', 1.0, float)
+            self.wait_seconds = self.initial_wait
+            self.min_interval = self._cfg('Retry', 'min_interval', 1.0, float)
+            self.max_interval = self._cfg('Retry', 'max_interval', 60.0, float)
+            self.backoff_factor = self._cfg('Retry', 'backoff_factor', 1.5, float)
+            self.max_consecutive_errors = self._cfg('Retry', 'max_consecutive_errors', 10, int)
+            self.update_interval = max(self._cfg('Telegram', 'update_interval', 10, int), 1)
+            self.target_count = self._cfg('Instance', 'target_count', 0, int)
+            self.dashboard_enabled = self._cfg('Dashboard', 'enabled', 'false').lower() == 'true'
+            self.dashboard_host = self._cfg('Dashboard', 'host', '0.0.0.0')
+            self.dashboard_port = self._cfg('Dashboard', 'port', 5000, int)
+            self.dashboard_server = self._cfg('Dashboard', 'server', 'waitress').strip().lower()
+            self.dashboard_threads = max(self._cfg('Dashboard', 'threads', 8, int), 1)
+            self._load_cached_config()
             
             # Phase 3: Service clients (OCI config from INI file)
+            self.configure_expect_header()
+            self._oci_clients = None
             self.clients = self.initialize_oci_clients()
             
             # Phase 4: Telegram integration
             self.tg_message_id = None
-            try:
-                self.tg_chat_id = self.config.get('Telegram', 'uid')
-            except:
-                self.tg_chat_id = ''
+            self._last_tg_update = float('-inf')
+            self.tg_chat_id = self._cfg('Telegram', 'uid', '')
             self.tg_bot = self.initialize_telegram()
+            # Messages are delivered by one worker so the retry loop never waits on Telegram
+            self._tg_queue: queue.Queue = queue.Queue()
+            self._tg_worker: Optional[threading.Thread] = None
+            if self.tg_bot:
+                self._tg_worker = threading.Thread(target=self._telegram_worker, name='telegram', daemon=True)
+                self._tg_worker.start()
             
             # Phase 5: Runtime state
             self.total_retries = 0
             self.retry_counter = 0
             self.last_error_code = None
+            self._sweep_throttled = False  # Set when an attempt of the current sweep got TooManyRequests
             self.start_time = None
+            self._start_monotonic = None  # Uptime clock, immune to wall-clock adjustments
             self.current_ad = None
-            self.instances_created = []
+            self.instances_created = deque(maxlen=INSTANCE_HISTORY_LIMIT)
             self.is_running = False
+            self._stop_event = threading.Event()  # Wakes the retry loop when the bot is stopped
+            # Dashboard runs go through one control thread that owns run(); see start()
+            self._control_queue: queue.Queue = queue.Queue()
+            self._control_lock = threading.Lock()
+            self._control_thread: Optional[threading.Thread] = None
+            self._start_pending = False
+            self._ad_cooldowns: Dict[str, float] = {}  # AD -> monotonic time it may be tried again
+            self._ad_failures: Dict[str, int] = {}
+            self._instance_ads: Dict[str, str] = {}  # Created instance ID -> its AD
+            self._run_created: List[str] = []  # Instances created by the current run
+            self._instance_count_cache: Optional[Tuple[int, int]] = None  # (time bucket, running count)
+            self._dashboard_subscribers: List[queue.Queue] = []
+            self._dashboard_subscribers_lock = threading.Lock()
             
             # Phase 6: Web Dashboard
-            dashboard_enabled = False
-            try:
-                dashboard_enabled = self.config.get('Dashboard', 'enabled').lower() == 'true'
-            except:
-                pass
-            
-            if FLASK_AVAILABLE and dashboard_enabled:
+            if FLASK_AVAILABLE and self.dashboard_enabled:
                 self.initialize_web_dashboard()
             
             logging.info("✅ OCI OCC Fix bot initialized successfully")
             
-            # Test Telegram connection
+            # Test Telegram connection (a failed delivery is logged by the worker)
             if self.tg_bot and self.tg_chat_id:
-                try:
-                    self.tg_bot.send_message(
-                        chat_id=self.tg_chat_id,
-                        text="🤖 OCI Bot başlatıldı ve hazır!",
-                        parse_mode='HTML'
-                    )
-                    logging.info("✅ Telegram test mesajı gönderildi")
-                except Exception as e:
-                    logging.warning(f"Telegram test mesajı gönderilemedi: {e}")
+                self._tg_queue.put(("🤖 OCI Bot başlatıldı ve hazır!", False))
             
         except Exception as e:
             logging.critical(f"Failed to initialize bot: {str(e)}")
@@ -710,6 +997,111 @@ class OciOccFix:
 
         return config
 
+    def _cfg(self, section: str, key: str, default: Any, cast=str) -> Any:
+        """Read a config value once, falling back to `default` when missing or invalid"""
+        try:
+            return cast(self.config.get(section, key))
+        except Exception:
+            return default
+
+    def _load_cached_config(self):
+        """Read the launch settings once; the INI does not change while the bot runs"""
+        self._region = self._cfg('DEFAULT', 'region', '')
+        self._compartment_id = self.config.get('OCI', 'compartment_id').strip()
+        self._subnet_id = self.config.get('OCI', 'subnet_id').strip()
+        self._image_id = self._cfg('OCI', 'image_id', '').strip()
+        self._boot_volume_id = self._cfg('OCI', 'boot_volume_id', '').strip()
+        self._boot_volume_size = self._cfg('Instance', 'boot_volume_size', 47, int)
+        self._display_name = self.config.get('Instance', 'display_name').strip()
+        self._assign_public_ip = self._cfg('Instance', 'assign_public_ip', 'true').lower() == 'true'
+        self._ssh_authorized_keys = self._resolve_ssh_keys()
+        self._shape = self.config.get('Machine', 'shape').strip()
+        self._is_flex = 'Flex' in self._shape
+        self._machine_type = self._cfg('Machine', 'type', '').strip().upper()
+        self._ocpus = self._cfg('Machine', 'ocpus', None, float)
+        self._memory = self._cfg('Machine', 'memory', None, float)
+        self._validate_shape_config()
+        
+        # Non-secret settings shown by the dashboard's /api/config
+        self._safe_config = {
+            'machine': {
+                'shape': self.config.get('Machine', 'shape', fallback=''),
+                'type': self.config.get('Machine', 'type', fallback=''),
+                'ocpus': self.config.get('Machine', 'ocpus', fallback=''),
+                'memory': self.config.get('Machine', 'memory', fallback='')
+            },
+            'instance': {
+                'display_name': self.config.get('Instance', 'display_name', fallback=''),
+                'boot_volume_size': self.config.get('Instance', 'boot_volume_size', fallback='')
+            },
+            'region': self.config.get('DEFAULT', 'region', fallback='')
+        }
+        
+        # None marks an unparsable value; run() reports it when the bot is started
+        try:
+            self._ads = [ad.strip() for ad in json.loads(self.config.get('OCI', 'availability_domains'))]
+        except (configparser.Error, ValueError, TypeError, AttributeError):
+            self._ads = None
+
+    def _validate_shape_config(self):
+        """Clamp flex OCPU/memory to the shape limits once and build the shape config"""
+        self._validated_ocpus = None
+        self._validated_memory = None
+        self._shape_config = None
+        if not self._is_flex:
+            return
+        
+        if self._ocpus is None or self._memory is None:
+            raise ValueError("Flex shapes need numeric ocpus and memory in [Machine]")
+        ocpus = self._ocpus
+        memory = self._memory
+        
+        # Validate ARM limits
+        if self._machine_type == 'ARM':
+            if ocpus > 4:
+                logging.warning(f"OCPUs {ocpus} exceeds ARM limit of 4, setting to 4")
+                ocpus = 4
+            if memory > 24:
+                logging.warning(f"Memory {memory}GB exceeds ARM limit of 24GB, setting to 24")
+                memory = 24
+            # ARM memory must be 6GB per OCPU
+            expected_memory = ocpus * 6
+            if memory != expected_memory:
+                logging.warning(f"ARM memory should be {expected_memory}GB for {ocpus} OCPUs, adjusting")
+                memory = expected_memory
+        
+        self._validated_ocpus = ocpus
+        self._validated_memory = memory
+        self._shape_config = oci.core.models.LaunchInstanceShapeConfigDetails(
+            ocpus=ocpus,
+            memory_in_gbs=memory
+        )
+
+    def _resolve_ssh_keys(self) -> str:
+        """Return the validated SSH public key(s), reading a 'file:' path once"""
+        ssh_keys = self._cfg('Instance', 'ssh_keys', '').strip()
+        
+        if not ssh_keys or ssh_keys == 'xxxx':
+            raise ValueError("SSH keys not configured properly")
+        
+        # If ssh_keys starts with 'file:', read from file
+        if ssh_keys.startswith('file:'):
+            ssh_key_file = ssh_keys.replace('file:', '').strip()
+            ssh_key_path = Path(ssh_key_file).expanduser()
+            if ssh_key_path.exists():
+                with open(ssh_key_path, 'r') as f:
+                    ssh_keys = f.read().strip()
+            else:
+                logging.error(f"SSH key file not found: {ssh_key_file}")
+                raise FileNotFoundError(f"SSH key file not found: {ssh_key_file}")
+        
+        # Validate SSH key format
+        if not ssh_keys.startswith(('ssh-rsa', 'ssh-ed25519', 'ecdsa-sha2')):
+            logging.error("Invalid SSH key format")
+            raise ValueError("SSH key must start with ssh-rsa, ssh-ed25519, or ecdsa-sha2")
+        
+        return ssh_keys
+
     def setup_logging(self):
         """Configure logging with rotation and proper formatting"""
         # Get log directory, with fallback
@@ -728,12 +1120,12 @@ class OciOccFix:
         except (configparser.NoSectionError, configparser.NoOptionError):
             log_level = 'INFO'  # Default to INFO level
         
-        formatter = logging.Formatter(
+        formatter = CachedTimeFormatter(
             '[%(levelname)s] %(asctime)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         
-        file_handler = RotatingFileHandler(
+        file_handler = BufferedRotatingFileHandler(
             log_file_path,
             maxBytes=MAX_LOG_SIZE,
             backupCount=LOG_BACKUP_COUNT,
@@ -753,13 +1145,33 @@ class OciOccFix:
     def initialize_web_dashboard(self):
         """Initialize Flask web dashboard"""
         global app
-        app = Flask(__name__)
-        app.config['SECRET_KEY'] = secrets.token_hex(32)
+        # static/ is served by our own route with long-lived cache headers
+        app = Flask(__name__, static_folder=None)
         CORS(app)
         
         # Store bot instance reference
         app.bot_instance = self
         
+        # Short-lived response cache shared by all dashboard tabs
+        if CACHING_AVAILABLE:
+            self.cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': 2})
+        else:
+            self.cache = None
+        
+        # Compile the login template once instead of re-parsing it on every request
+        app.login_tmpl = app.jinja_env.from_string(LOGIN_HTML)
+        
+        username = self._cfg('Dashboard', 'username', 'admin')
+        password = self._cfg('Dashboard', 'password', 'admin123')
+        
+        # Hash the credentials once; logins never go back to the config
+        self._dashboard_user = username.encode('utf-8')
+        self._dashboard_pw_hash = self.hash_dashboard_password(password)
+        
+        # Server-side login tokens: token -> expiry (monotonic seconds)
+        self._dashboard_sessions: Dict[str, float] = {}
+        self._dashboard_sessions_lock = threading.RLock()
+        
         # Setup routes
         self.setup_web_routes()
         
@@ -768,143 +1180,228 @@ class OciOccFix:
         dashboard_thread.daemon = True
         dashboard_thread.start()
         
-        try:
-            dashboard_host = self.config.get('Dashboard', 'host')
-        except:
-            dashboard_host = '0.0.0.0'
-        
-        try:
-            dashboard_port = int(self.config.get('Dashboard', 'port'))
-        except:
-            dashboard_port = 5000
-        
-        dashboard_url = f"http://{dashboard_host}:{dashboard_port}"
+        dashboard_url = f"http://{self.dashboard_host}:{self.dashboard_port}"
         logging.info(f"✅ Web dashboard started at {dashboard_url}")
         
-        try:
-            username = self.config.get('Dashboard', 'username')
-        except:
-            username = 'admin'
-        
-        try:
-            password = self.config.get('Dashboard', 'password')
-        except:
-            password = 'admin123'
-        
         print(f"\n{'='*50}")
         print(f"🌐 Web Dashboard: {dashboard_url}")
         print(f"👤 Username: {username}")
         print(f"🔑 Password: {password}")
         print(f"{'='*50}\n")
 
+    @staticmethod
+    def hash_dashboard_password(password: str) -> bytes:
+        """Hash a dashboard password (bcrypt when installed, SHA-256 otherwise)"""
+        # Pre-hash so bcrypt's 72-byte input limit never truncates long passwords
+        digest = hashlib.sha256(password.encode('utf-8')).hexdigest().encode('ascii')
+        if BCRYPT_AVAILABLE:
+            return bcrypt.hashpw(digest, bcrypt.gensalt())
+        return digest
+
+    def check_dashboard_credentials(self, username: str, password: str) -> bool:
+        """Check dashboard credentials without leaking timing information"""
+        user_ok = hmac.compare_digest(username.encode('utf-8'), self._dashboard_user)
+        digest = hashlib.sha256(password.encode('utf-8')).hexdigest().encode('ascii')
+        if BCRYPT_AVAILABLE:
+            password_ok = bcrypt.checkpw(digest, self._dashboard_pw_hash)
+        else:
+            password_ok = hmac.compare_digest(digest, self._dashboard_pw_hash)
+        return user_ok and password_ok
+
+    def create_dashboard_session(self) -> str:
+        """Issue a new dashboard login token"""
+        token = secrets.token_urlsafe(32)
+        now = time.monotonic()
+        with self._dashboard_sessions_lock:
+            expired = [t for t, expiry in self._dashboard_sessions.items() if expiry <= now]
+            for t in expired:
+                del self._dashboard_sessions[t]
+            self._dashboard_sessions[token] = now + DASHBOARD_SESSION_TTL
+        return token
+
+    def is_dashboard_session_valid(self, token: Optional[str]) -> bool:
+        """Check a dashboard login token with a single dict lookup"""
+        if not token:
+            return False
+        with self._dashboard_sessions_lock:
+            expiry = self._dashboard_sessions.get(token)
+        return expiry is not None and expiry > time.monotonic()
+
+    def end_dashboard_session(self, token: Optional[str]):
+        """Invalidate a dashboard login token"""
+        with self._dashboard_sessions_lock:
+            self._dashboard_sessions.pop(token, None)
+
     def setup_web_routes(self):
         """Setup Flask routes"""
         
+        def cached(timeout: int):
+            """Memoize a view for `timeout` seconds when Flask-Caching is installed"""
+            if self.cache is None:
+                return lambda view: view
+            return self.cache.cached(timeout=timeout)
+        
+        def login_required(view):
+            """Reject requests without a valid login token"""
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                token = request.cookies.get(DASHBOARD_SESSION_COOKIE)
+                if not app.bot_instance.is_dashboard_session_valid(token):
+                    if request.path.startswith('/api/'):
+                        return fast_jsonify({'error': 'Unauthorized'}), 401
+                    return redirect(url_for('login'))
+                return view(*args, **kwargs)
+            return wrapper
+        
         @app.route('/')
+        @login_required
         def index():
-            if not session.get('logged_in'):
-                return redirect(url_for('login'))
-            return render_template_string(DASHBOARD_HTML)
+            if 'gzip' in request.accept_encodings:
+                response = Response(DASHBOARD_GZ, mimetype='text/html')
+                response.headers['Content-Encoding'] = 'gzip'
+            else:
+                response = Response(DASHBOARD_BODY, mimetype='text/html')
+            response.headers['Cache-Control'] = DASHBOARD_CACHE_CONTROL
+            response.vary.add('Accept-Encoding')
+            # Weak ETag: both encodings carry the same page
+            response.set_etag(DASHBOARD_ETAG, weak=True)
+            return response.make_conditional(request)
+        
+        @app.route('/static/app.css')
+        def app_css():
+            if 'gzip' in request.accept_encodings:
+                response = Response(APP_CSS_GZ, mimetype='text/css')
+                response.headers['Content-Encoding'] = 'gzip'
+            else:
+                response = Response(APP_CSS, mimetype='text/css')
+            response.headers['Cache-Control'] = STATIC_CACHE_CONTROL
+            response.vary.add('Accept-Encoding')
+            response.set_etag(APP_CSS_ETAG, weak=True)
+            return response.make_conditional(request)
         
         @app.route('/login', methods=['GET', 'POST'])
         def login():
             if request.method == 'POST':
-                username = request.form.get('username')
-                password = request.form.get('password')
-                
-                config_username = app.bot_instance.config.get('Dashboard', 'username', fallback='admin')
-                config_password = app.bot_instance.config.get('Dashboard', 'password', fallback='admin123')
+                username = request.form.get('username', '')
+                password = request.form.get('password', '')
                 
-                if username == config_username and password == config_password:
-                    session['logged_in'] = True
-                    return redirect(url_for('index'))
+                if app.bot_instance.check_dashboard_credentials(username, password):
+                    response = redirect(url_for('index'))
+                    response.set_cookie(
+                        DASHBOARD_SESSION_COOKIE,
+                        app.bot_instance.create_dashboard_session(),
+                        max_age=DASHBOARD_SESSION_TTL,
+                        httponly=True,
+                        samesite='Lax'
+                    )
+                    return response
                 else:
-                    return render_template_string(LOGIN_HTML, error='Invalid credentials')
+                    return app.login_tmpl.render(error='Invalid credentials')
             
-            return render_template_string(LOGIN_HTML)
+            return app.login_tmpl.render()
         
         @app.route('/logout')
         def logout():
-            session.pop('logged_in', None)
-            return redirect(url_for('login'))
+            app.bot_instance.end_dashboard_session(request.cookies.get(DASHBOARD_SESSION_COOKIE))
+            response = redirect(url_for('login'))
+            response.delete_cookie(DASHBOARD_SESSION_COOKIE)
+            return response
         
         @app.route('/api/status')
+        @login_required
+        @cached(timeout=2)
         def api_status():
-            return jsonify(dashboard_data)
+            return fast_jsonify(dashboard_snapshot())
+        
+        @app.route('/api/stream')
+        @login_required
+        def api_stream():
+            # gevent runs without monkey-patching, so a blocking queue wait would stall its hub
+            if app.bot_instance.dashboard_server == 'gevent' and GEVENT_AVAILABLE:
+                return fast_jsonify({'error': 'Streaming not supported by this server'}), 503
+            
+            subscriber = app.bot_instance.subscribe_dashboard()
+            if subscriber is None:
+                # Each stream holds a server thread; the page falls back to polling on 503
+                return fast_jsonify({'error': 'Too many dashboard streams'}), 503
+            
+            def stream():
+                try:
+                    yield f"data: {fast_dumps(dashboard_snapshot())}\n\n"
+                    while True:
+                        try:
+                            payload = subscriber.get(timeout=DASHBOARD_STREAM_KEEPALIVE)
+                        except queue.Empty:
+                            # Comment line keeps proxies from closing the connection
+                            yield ": keepalive\n\n"
+                            continue
+                        yield f"data: {payload}\n\n"
+                finally:
+                    app.bot_instance.unsubscribe_dashboard(subscriber)
+            
+            return Response(
+                stream(),
+                mimetype='text/event-stream',
+                headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+            )
         
         @app.route('/api/config')
+        @login_required
         def api_config():
-            safe_config = {
-                'machine': {
-                    'shape': app.bot_instance.config.get('Machine', 'shape', fallback=''),
-                    'type': app.bot_instance.config.get('Machine', 'type', fallback=''),
-                    'ocpus': app.bot_instance.config.get('Machine', 'ocpus', fallback=''),
-                    'memory': app.bot_instance.config.get('Machine', 'memory', fallback='')
-                },
-                'instance': {
-                    'display_name': app.bot_instance.config.get('Instance', 'display_name', fallback=''),
-                    'boot_volume_size': app.bot_instance.config.get('Instance', 'boot_volume_size', fallback='')
-                },
-                'region': app.bot_instance.config.get('DEFAULT', 'region', fallback='')
-            }
-            return jsonify(safe_config)
+            return fast_jsonify(app.bot_instance._safe_config)
         
         @app.route('/api/control/<action>', methods=['POST'])
+        @login_required
         def api_control(action):
-            if not session.get('logged_in'):
-                return jsonify({'error': 'Unauthorized'}), 401
-            
             if action == 'start':
-                if not app.bot_instance.is_running:
-                    thread = threading.Thread(target=app.bot_instance.run)
-                    thread.daemon = True
-                    thread.start()
-                    return jsonify({'status': 'started'})
+                if app.bot_instance.start():
+                    return fast_jsonify({'status': 'started'})
                 else:
-                    return jsonify({'error': 'Bot is already running'}), 400
+                    return fast_jsonify({'error': 'Bot is already running'}), 400
             
             elif action == 'stop':
-                app.bot_instance.is_running = False
-                dashboard_data['bot_status'] = 'stopped'
-                return jsonify({'status': 'stopped'})
+                app.bot_instance.stop()
+                return fast_jsonify({'status': 'stopped'})
             
             elif action == 'restart':
-                app.bot_instance.is_running = False
-                time.sleep(2)
-                thread = threading.Thread(target=app.bot_instance.run)
-                thread.daemon = True
-                thread.start()
-                return jsonify({'status': 'restarting'})
+                # The new run is queued behind the current one, so the two never overlap
+                app.bot_instance.stop()
+                app.bot_instance.start()
+                return fast_jsonify({'status': 'restarting'})
             
-            return jsonify({'error': 'Invalid action'}), 400
+            return fast_jsonify({'error': 'Invalid action'}), 400
 
     def run_flask_app(self):
         """Run Flask application"""
-        try:
-            host = self.config.get('Dashboard', 'host')
-        except:
-            host = '0.0.0.0'
-        
-        try:
-            port = int(self.config.get('Dashboard', 'port'))
-        except:
-            port = 5000
-        
-        app.run(
-            host=host,
-            port=port,
-            debug=False,
-            use_reloader=False
-        )
+        host = self.dashboard_host
+        port = self.dashboard_port
+        server = self.dashboard_server
+        
+        if server == 'waitress' and WAITRESS_AVAILABLE:
+            logging.info(f"Dashboard served by waitress ({self.dashboard_threads} threads)")
+            # Lookahead lets waitress notice closed clients, ending their dashboard streams
+            waitress_serve(app, host=host, port=port, threads=self.dashboard_threads,
+                           channel_request_lookahead=1, _quiet=True)
+        elif server == 'gevent' and GEVENT_AVAILABLE:
+            logging.info("Dashboard served by gevent")
+            WSGIServer((host, port), app, log=None).serve_forever()
+        else:
+            if server != 'werkzeug':
+                logging.warning(f"Dashboard server '{server}' not available, using Flask development server")
+            app.run(
+                host=host,
+                port=port,
+                debug=False,
+                use_reloader=False,
+                threaded=True
+            )
 
     def update_dashboard(self, **kwargs):
         """Update dashboard data"""
-        dashboard_data.update(kwargs)
+        with dashboard_lock:
+            dashboard_data.update(kwargs)
         
-        # Update statistics
-        if self.total_retries > 0:
-            success_rate = (len(self.instances_created) / self.total_retries) * 100
-            dashboard_data['statistics']['success_rate'] = success_rate
+        self.publish_dashboard()
 
     def add_dashboard_log(self, level: str, message: str):
         """Add log entry to dashboard"""
@@ -914,26 +1411,120 @@ class OciOccFix:
             'message': message
         }
         
-        dashboard_data['logs'].append(log_entry)
+        # Bounded deque drops the oldest entry on its own
+        with dashboard_lock:
+            dashboard_data['logs'].append(log_entry)
+        
+        self.publish_dashboard()
+
+    def _bump_error(self, code: str):
+        """Count one failed attempt and record it as the last error"""
+        with dashboard_lock:
+            errors_by_type = dashboard_data['statistics']['errors_by_type']
+            errors_by_type[code] += 1
+            if len(errors_by_type) > ERROR_TYPES_LIMIT:
+                # Unknown codes from the API must not grow the tally forever
+                kept = errors_by_type.most_common(ERROR_TYPES_KEEP)
+                errors_by_type.clear()
+                errors_by_type.update(dict(kept))
+            dashboard_data['last_error'] = code
+        
+        self.publish_dashboard()
+
+    def subscribe_dashboard(self) -> Optional[queue.Queue]:
+        """Register a dashboard stream; returns None once the stream limit is reached"""
+        limit = max(self.dashboard_threads - DASHBOARD_STREAM_RESERVED_THREADS, 1)
+        subscriber = queue.Queue(maxsize=1)
+        with self._dashboard_subscribers_lock:
+            if len(self._dashboard_subscribers) >= limit:
+                return None
+            self._dashboard_subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe_dashboard(self, subscriber: queue.Queue):
+        """Remove a dashboard stream"""
+        with self._dashboard_subscribers_lock:
+            if subscriber in self._dashboard_subscribers:
+                self._dashboard_subscribers.remove(subscriber)
+
+    def publish_dashboard(self):
+        """Push the current dashboard snapshot to every open stream"""
+        with self._dashboard_subscribers_lock:
+            subscribers = list(self._dashboard_subscribers)
+        if not subscribers:
+            return
+        
+        payload = fast_dumps(dashboard_snapshot())
+        for subscriber in subscribers:
+            # Slow clients only need the newest state, so replace anything still queued
+            try:
+                subscriber.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                subscriber.put_nowait(payload)
+            except queue.Full:
+                pass
+
+    def configure_expect_header(self):
+        """Disable the OCI SDK Expect: 100-continue handshake unless configured otherwise"""
+        try:
+            sdk_version = tuple(int(part) for part in oci.__version__.split('.')[:3])
+            low, high = EXPECT_HEADER_AFFECTED_VERSIONS
+            if low <= sdk_version < high:
+                logging.warning(
+                    f"OCI SDK {oci.__version__} adds ~3s per request with Expect: 100-continue, "
+                    f"upgrade to oci>=2.43.0"
+                )
+        except (AttributeError, ValueError):
+            pass
         
-        # Keep only last 200 logs
-        if len(dashboard_data['logs']) > 200:
-            dashboard_data['logs'] = dashboard_data['logs'][-200:]
+        if self._cfg('OCI', 'disable_expect_100', 'true').lower() != 'true':
+            return
+        
+        os.environ.setdefault('OCI_PYSDK_USING_EXPECT_HEADER', 'FALSE')
+        # The SDK reads the variable once at import time, so apply it to the loaded module too
+        if os.environ['OCI_PYSDK_USING_EXPECT_HEADER'].lower() == 'false':
+            oci.base_client.enable_expect_header = False
+            logging.debug("OCI Expect: 100-continue header disabled")
 
     def initialize_oci_clients(self) -> Dict[str, Any]:
         """Initialize OCI service clients using configuration from INI file"""
+        # Clients are reusable for the life of the process
+        if self._oci_clients is not None:
+            return self._oci_clients
+        
         try:
             oci_config = self.build_oci_config()
             oci.config.validate_config(oci_config)
             
+            # One signer for every client, so the PEM key is read and parsed once
+            signer = oci.signer.Signer(
+                tenancy=oci_config['tenancy'],
+                user=oci_config['user'],
+                fingerprint=oci_config['fingerprint'],
+                private_key_file_location=oci_config['key_file'],
+                pass_phrase=oci_config.get('pass_phrase')
+            )
+            
             clients = {
-                'compute': oci.core.ComputeClient(oci_config),
-                'identity': oci.identity.IdentityClient(oci_config),
-                'network': oci.core.VirtualNetworkClient(oci_config),
-                'blockstorage': oci.core.BlockstorageClient(oci_config)
+                'compute': oci.core.ComputeClient(oci_config, signer=signer, timeout=OCI_TIMEOUT),
+                'identity': oci.identity.IdentityClient(oci_config, signer=signer),
+                'network': oci.core.VirtualNetworkClient(oci_config, signer=signer),
+                'blockstorage': oci.core.BlockstorageClient(oci_config, signer=signer)
             }
             
+            # Keep enough warm HTTPS connections for concurrent AD attempts. Newer SDKs
+            # mount their own adapter subclass; reuse it so OCI transport tweaks survive.
+            adapter_cls = getattr(oci.base_client, 'OCIHTTPAdapter', HTTPAdapter)
+            clients['compute'].base_client.session.mount('https://', adapter_cls(
+                pool_connections=OCI_POOL_CONNECTIONS,
+                pool_maxsize=OCI_POOL_MAXSIZE,
+                pool_block=False
+            ))
+            
             logging.info("OCI clients initialized successfully")
+            self._oci_clients = clients
             return clients
             
         except Exception as e:
@@ -948,28 +1539,15 @@ class OciOccFix:
             
             # Check for OCI credentials in DEFAULT section or root level
             required_keys = ['user', 'fingerprint', 'key_file', 'tenancy', 'region']
+            optional_keys = ['pass_phrase']
             
-            # Try DEFAULT section first
-            for key in required_keys:
-                try:
-                    value = self.config.get('DEFAULT', key)
-                    if value:
-                        oci_config[key] = value
-                except (configparser.NoSectionError, configparser.NoOptionError):
-                    pass
-            
-            # If not all keys found, try without section
-            if len(oci_config) != len(required_keys):
-                oci_config = {}
-                for key in required_keys:
-                    for section in self.config.sections() + ['DEFAULT']:
-                        try:
-                            value = self.config.get(section, key)
-                            if value and key not in oci_config:
-                                oci_config[key] = value
-                                break
-                        except (configparser.NoSectionError, configparser.NoOptionError):
-                            continue
+            # One pass, DEFAULT first; the first non-empty value of each key wins
+            for section in ['DEFAULT', *self.config.sections()]:
+                for key in required_keys + optional_keys:
+                    if key not in oci_config and self.config.has_option(section, key):
+                        value = self.config.get(section, key)
+                        if value:
+                            oci_config[key] = value
             
             # Validate we have all required keys
             missing_keys = [k for k in required_keys if k not in oci_config]
@@ -1024,8 +1602,18 @@ class OciOccFix:
             return None
             
         try:
+            # One keep-alive HTTPS session for every Telegram call instead of a new handshake each time
+            telegram_session = requests.Session()
+            telegram_session.mount('https://', HTTPAdapter(
+                pool_connections=TELEGRAM_POOL_SIZE,
+                pool_maxsize=TELEGRAM_POOL_SIZE,
+                max_retries=Retry(total=2, backoff_factor=0.2)
+            ))
+            telebot.apihelper.session = telegram_session
+            telebot.apihelper.SESSION_TIME_TO_LIVE = None
+            
+            # No get_me() probe: the greeting sent after startup shows whether the token works
             bot = telebot.TeleBot(bot_token, parse_mode='HTML')
-            bot.get_me()
             self.tg_chat_id = chat_id
             logging.info("Telegram bot initialized successfully")
             return bot
@@ -1035,69 +1623,115 @@ class OciOccFix:
 
     # TELEGRAM NOTIFICATION FUNCTIONS - YENİ EKLENDİ
     def send_telegram_message(self, message: str, update_existing: bool = False):
-        """Send or update Telegram message"""
+        """Queue a Telegram message; update_existing edits the status message instead"""
         if not self.tg_bot or not self.tg_chat_id:
             return
         
-        try:
-            # HTML formatında mesaj
-            formatted_message = f"🤖 <b>OCI Bot Status</b>\n\n{message}"
+        # Status updates edit one message, at most once per TELEGRAM_EDIT_INTERVAL
+        if update_existing:
+            now = time.monotonic()
+            if now - self._last_tg_update < TELEGRAM_EDIT_INTERVAL:
+                return
+            self._last_tg_update = now
+        
+        # HTML formatında mesaj
+        self._tg_queue.put((f"🤖 <b>OCI Bot Status</b>\n\n{message}", update_existing))
+
+    def close_telegram(self, timeout: float = 10):
+        """Deliver the queued messages, then stop the Telegram worker"""
+        if self._tg_worker is not None:
+            self._tg_queue.put(None)
+            self._tg_worker.join(timeout)
+
+    def _telegram_worker(self):
+        """Deliver queued messages in order, keeping only the newest pending status update"""
+        while True:
+            batch = [self._tg_queue.get()]
+            while True:
+                try:
+                    batch.append(self._tg_queue.get_nowait())
+                except queue.Empty:
+                    break
             
+            closing = None in batch
+            items = [item for item in batch if item is not None]
+            statuses = [item for item in items if item[1]]
+            for text, update_existing in items:
+                if not update_existing:
+                    self._deliver_telegram(text, False)
+            if statuses:
+                self._deliver_telegram(statuses[-1][0], True)
+            if closing:
+                return
+
+    def _deliver_telegram(self, text: str, update_existing: bool):
+        """Send or edit one Telegram message; runs on the Telegram worker only"""
+        try:
             if update_existing and self.tg_message_id:
                 # Mevcut mesajı güncelle
-                self.tg_bot.edit_message_text(
-                    chat_id=self.tg_chat_id,
-                    message_id=self.tg_message_id,
-                    text=formatted_message,
-                    parse_mode='HTML'
-                )
-            else:
-                # Yeni mesaj gönder
-                msg = self.tg_bot.send_message(
-                    chat_id=self.tg_chat_id,
-                    text=formatted_message,
-                    parse_mode='HTML'
-                )
+                try:
+                    self.tg_bot.edit_message_text(
+                        chat_id=self.tg_chat_id,
+                        message_id=self.tg_message_id,
+                        text=text,
+                        parse_mode='HTML'
+                    )
+                    return
+                except telebot.apihelper.ApiTelegramException as e:
+                    if 'message is not modified' in str(e):
+                        return
+                    # Status message was deleted or can no longer be edited
+                    logging.debug("Telegram status message not editable, sending a new one: %s", e)
+                    self.tg_message_id = None
+            
+            # Yeni mesaj gönder
+            msg = self.tg_bot.send_message(
+                chat_id=self.tg_chat_id,
+                text=text,
+                parse_mode='HTML'
+            )
+            # Only status updates are edited later; one-off notifications stay as sent
+            if update_existing:
                 self.tg_message_id = msg.message_id
                 
         except Exception as e:
             logging.warning(f"Failed to send Telegram message: {str(e)}")
 
+    def uptime_seconds(self) -> int:
+        """Whole seconds since the current run started"""
+        if self._start_monotonic is None:
+            return 0
+        return int(time.monotonic() - self._start_monotonic)
+
     def format_status_message(self) -> str:
         """Format status message for Telegram"""
-        uptime = datetime.datetime.now() - self.start_time if self.start_time else datetime.timedelta(0)
-        hours = int(uptime.total_seconds() // 3600)
-        minutes = int((uptime.total_seconds() % 3600) // 60)
-        
-        message = f"""📊 <b>Statistics:</b>
-• Total Attempts: {self.total_retries}
-• Current AD: {self.current_ad or 'N/A'}
-• Retry Interval: {self.wait_seconds:.1f}s
-• Uptime: {hours}h {minutes}m
-
-🔄 <b>Last Error:</b> {self.last_error_code or 'None'}
-✅ <b>Instances Created:</b> {len(self.instances_created)}
-"""
+        uptime = self.uptime_seconds()
+        hours = uptime // 3600
+        minutes = uptime % 3600 // 60
+        
+        message = TG_STATUS_TEMPLATE.format_map({
+            'total_attempts': self.total_retries,
+            'current_ad': self.current_ad or 'N/A',
+            'retry_interval': self.wait_seconds,
+            'hours': hours,
+            'minutes': minutes,
+            'last_error': self.last_error_code or 'None',
+            'instances_created': len(self.instances_created)
+        })
         
         if self.instances_created:
             message += "\n📝 <b>Instance IDs:</b>\n"
-            for instance_id in self.instances_created[-3:]:  # Son 3 instance
+            for instance_id in list(self.instances_created)[-3:]:  # Son 3 instance
                 message += f"• <code>{instance_id}</code>\n"
         
         return message
 
     def send_periodic_update(self):
-        """Send periodic status update to Telegram"""
-        try:
-            update_interval = int(self.config.get('Telegram', 'update_interval', fallback=10))
-        except:
-            update_interval = 10
-        
-        if self.total_retries % update_interval == 0 and self.total_retries > 0:
-            self.send_telegram_message(self.format_status_message(), update_existing=True)
+        """Send periodic status update to Telegram; run() calls it every update_interval attempts"""
+        self.send_telegram_message(self.format_status_message(), update_existing=True)
 
-    def create_instance(self, availability_domain: str) -> Optional[str]:
-        """Attempt to create an instance"""
+    def create_instance(self, availability_domain: str) -> Tuple[Optional[str], Optional[str]]:
+        """Attempt to create an instance; returns (instance ID, critical Telegram alert)"""
         try:
             self.current_ad = availability_domain
             self.update_dashboard(
@@ -1105,7 +1739,7 @@ class OciOccFix:
                 retry_interval=self.wait_seconds
             )
             
-            launch_details = self.build_launch_details(availability_domain)
+            launch_details = self._launch_details[availability_domain]
             
             logging.info(f"Attempting to create instance in {availability_domain}")
             self.add_dashboard_log('INFO', f"Attempting to create instance in {availability_domain}")
@@ -1118,229 +1752,78 @@ class OciOccFix:
             logging.info(f"✅ Instance created successfully: {instance_id}")
             self.add_dashboard_log('INFO', f"Instance created: {instance_id}")
             
-            self.instances_created.append(instance_id)
+            with dashboard_lock:
+                self.instances_created.append(instance_id)
+                self._run_created.append(instance_id)
+                self._instance_ads[instance_id] = availability_domain
+                dashboard_data['statistics']['successes'] += 1
             self.update_dashboard(instances_created=self.instances_created)
             
-            # TELEGRAM BAŞARI BİLDİRİMİ - YENİ EKLENDİ
-            success_message = f"""
-🎉 <b>SUCCESS!</b> 🎉
-
-✅ Instance created successfully!
-
-📋 <b>Details:</b>
-• Instance ID: <code>{instance_id}</code>
-• AD: {availability_domain}
-• Shape: {self.config.get('Machine', 'shape')}
-• Display Name: {self.config.get('Instance', 'display_name')}
-• Total Attempts: {self.total_retries}
-
-⏱ Time taken: {datetime.datetime.now() - self.start_time if self.start_time else 'N/A'}
-"""
-            self.send_telegram_message(success_message)
-            
-            return instance_id
+            # Success is announced by run(), once every sibling attempt has finished
+            return instance_id, None
             
         except oci.exceptions.ServiceError as e:
-            self.last_error_code = e.code
+            code = e.code
+            # "Out of host capacity" sometimes arrives disguised as InternalError
+            if code == 'InternalError' and 'Out of host capacity' in str(e.message):
+                code = 'OutOfHostCapacity'
+            self.last_error_code = code
+            if code == 'TooManyRequests':
+                self._sweep_throttled = True
+            self._bump_error(code)
+            if code in CAPACITY_ERRORS:
+                self.cool_down_ad(availability_domain)
             
-            # Check if it's actually "Out of host capacity" disguised as InternalError
-            if e.code == 'InternalError' and 'Out of host capacity' in str(e.message):
-                # This is actually an out of capacity error
-                self.last_error_code = 'OutOfHostCapacity'
-                
-                if 'OutOfHostCapacity' in dashboard_data['statistics']['errors_by_type']:
-                    dashboard_data['statistics']['errors_by_type']['OutOfHostCapacity'] += 1
-                else:
-                    dashboard_data['statistics']['errors_by_type']['OutOfHostCapacity'] = 1
-                
-                self.update_dashboard(last_error='OutOfHostCapacity')
-                
-                # Don't log as warning, this is expected
-                logging.debug(f"Out of capacity in {availability_domain}")
-                self.add_dashboard_log('INFO', f"Out of capacity in {availability_domain}")
-                
-            elif e.code == 'InternalError':
-                # Real internal error (not capacity related)
-                if e.code in dashboard_data['statistics']['errors_by_type']:
-                    dashboard_data['statistics']['errors_by_type'][e.code] += 1
-                else:
-                    dashboard_data['statistics']['errors_by_type'][e.code] = 1
-                
-                self.update_dashboard(last_error=e.code)
-                
-                logging.warning(f"Internal error in {availability_domain}")
-                logging.debug(f"Full error message: {e.message}")
-                logging.debug(f"Request ID: {e.request_id if hasattr(e, 'request_id') else 'N/A'}")
-                self.add_dashboard_log('WARNING', f"Internal error (not capacity related)")
-                
-            elif e.code in ['OutOfCapacity', 'OutOfBareMetalCapacity', 'OutOfHostCapacity']:
-                if e.code in dashboard_data['statistics']['errors_by_type']:
-                    dashboard_data['statistics']['errors_by_type'][e.code] += 1
-                else:
-                    dashboard_data['statistics']['errors_by_type'][e.code] = 1
-                
-                self.update_dashboard(last_error=e.code)
-                
-                logging.debug(f"Out of capacity in {availability_domain}")
-                self.add_dashboard_log('INFO', f"Out of capacity in {availability_domain}")
-                
-            elif e.code == 'TooManyRequests':
-                if e.code in dashboard_data['statistics']['errors_by_type']:
-                    dashboard_data['statistics']['errors_by_type'][e.code] += 1
-                else:
-                    dashboard_data['statistics']['errors_by_type'][e.code] = 1
-                
-                self.update_dashboard(last_error=e.code)
-                
-                logging.warning(f"Too many requests - slowing down")
-                self.add_dashboard_log('WARNING', "Too many requests - slowing down")
-                
-            elif e.code == 'LimitExceeded':
-                if e.code in dashboard_data['statistics']['errors_by_type']:
-                    dashboard_data['statistics']['errors_by_type'][e.code] += 1
-                else:
-                    dashboard_data['statistics']['errors_by_type'][e.code] = 1
-                
-                self.update_dashboard(last_error=e.code)
-                
-                logging.error(f"Limit exceeded: {e.message}")
-                self.add_dashboard_log('ERROR', f"Limit exceeded - check your quotas")
-                
-                # TELEGRAM KRİTİK HATA BİLDİRİMİ - YENİ EKLENDİ
-                error_msg = f"""
-⚠️ <b>Critical Error!</b>
-
-❌ Error Code: {e.code}
-📝 Message: {e.message}
-
-🔧 Bot may need configuration check!
-"""
-                self.send_telegram_message(error_msg)
-                
-            elif e.code == 'InvalidParameter':
-                if e.code in dashboard_data['statistics']['errors_by_type']:
-                    dashboard_data['statistics']['errors_by_type'][e.code] += 1
-                else:
-                    dashboard_data['statistics']['errors_by_type'][e.code] = 1
-                
-                self.update_dashboard(last_error=e.code)
-                
-                logging.error(f"Invalid parameter: {e.message}")
-                self.add_dashboard_log('ERROR', f"Invalid parameter in request")
-                
-                # TELEGRAM KRİTİK HATA BİLDİRİMİ - YENİ EKLENDİ
-                error_msg = f"""
-⚠️ <b>Critical Error!</b>
-
-❌ Error Code: {e.code}
-📝 Message: {e.message}
-
-🔧 Bot may need configuration check!
-"""
-                self.send_telegram_message(error_msg)
-                
-            else:
-                if e.code in dashboard_data['statistics']['errors_by_type']:
-                    dashboard_data['statistics']['errors_by_type'][e.code] += 1
-                else:
-                    dashboard_data['statistics']['errors_by_type'][e.code] = 1
-                
-                self.update_dashboard(last_error=e.code)
-                
-                logging.warning(f"Service error in {availability_domain}: {e.code} - {e.message}")
-                self.add_dashboard_log('WARNING', f"Service error: {e.code}")
+            log_level, log_msg, dash_level, dash_msg, notify = self.ERROR_HANDLERS.get(code, self.DEFAULT_ERROR_HANDLER)
+            fields = {'ad': availability_domain, 'code': code, 'message': e.message}
+            # Capacity errors log at DEBUG on every attempt; skip formatting when it is filtered out
+            root_logger = logging.getLogger()
+            if root_logger.isEnabledFor(log_level):
+                logging.log(log_level, log_msg.format_map(fields))
+            if log_level > logging.DEBUG and root_logger.isEnabledFor(logging.DEBUG):
+                logging.debug("Full error message: %s (request ID: %s)", e.message, getattr(e, 'request_id', 'N/A'))
+            self.add_dashboard_log(dash_level, dash_msg.format_map(fields))
             
-            return None
+            # TELEGRAM KRİTİK HATA BİLDİRİMİ - YENİ EKLENDİ
+            # Sent by attempt_sweep, and only when no sibling attempt succeeded
+            return None, TG_CRITICAL_TEMPLATE.format_map(fields) if notify else None
             
         except Exception as e:
             logging.error(f"Unexpected error: {str(e)}")
             logging.error(f"Error type: {type(e).__name__}")
             self.add_dashboard_log('ERROR', f"Unexpected error: {str(e)}")
-            return None
+            return None, None
 
     def build_launch_details(self, availability_domain: str):
         """Build instance launch configuration"""
         try:
-            # Get and validate SSH keys
-            ssh_keys = self.config.get('Instance', 'ssh_keys').strip()
-            
-            if not ssh_keys or ssh_keys == 'xxxx':
-                raise ValueError("SSH keys not configured properly")
-            
-            # If ssh_keys starts with 'file:', read from file
-            if ssh_keys.startswith('file:'):
-                ssh_key_file = ssh_keys.replace('file:', '').strip()
-                ssh_key_path = Path(ssh_key_file).expanduser()
-                if ssh_key_path.exists():
-                    with open(ssh_key_path, 'r') as f:
-                        ssh_keys = f.read().strip()
-                else:
-                    logging.error(f"SSH key file not found: {ssh_key_file}")
-                    raise FileNotFoundError(f"SSH key file not found: {ssh_key_file}")
-            
-            # Validate SSH key format
-            if not ssh_keys.startswith(('ssh-rsa', 'ssh-ed25519', 'ecdsa-sha2')):
-                logging.error("Invalid SSH key format")
-                raise ValueError("SSH key must start with ssh-rsa, ssh-ed25519, or ecdsa-sha2")
-            
-            # Clean up availability domain
-            ad_clean = availability_domain.strip()
-            
             # Log configuration for debugging
-            logging.debug(f"Building launch config:")
-            logging.debug(f"  AD: {ad_clean}")
-            logging.debug(f"  Compartment: {self.config.get('OCI', 'compartment_id')[:30]}...")
-            logging.debug(f"  Shape: {self.config.get('Machine', 'shape')}")
-            logging.debug(f"  Subnet: {self.config.get('OCI', 'subnet_id')[:30]}...")
-            
-            # Get assign_public_ip setting
-            try:
-                assign_public_ip = self.config.get('Instance', 'assign_public_ip').lower() == 'true'
-            except:
-                assign_public_ip = True
+            logging.debug("Building launch config:")
+            logging.debug("  AD: %s", availability_domain)
+            logging.debug("  Compartment: %.30s...", self._compartment_id)
+            logging.debug("  Shape: %s", self._shape)
+            logging.debug("  Subnet: %.30s...", self._subnet_id)
             
             # Build launch details
             launch_details = oci.core.models.LaunchInstanceDetails(
                 metadata={
-                    "ssh_authorized_keys": ssh_keys
+                    "ssh_authorized_keys": self._ssh_authorized_keys
                 },
-                availability_domain=ad_clean,
-                compartment_id=self.config.get('OCI', 'compartment_id').strip(),
-                shape=self.config.get('Machine', 'shape').strip(),
-                display_name=self.config.get('Instance', 'display_name').strip(),
-                source_details=self.get_source_details(),
+                availability_domain=availability_domain,
+                compartment_id=self._compartment_id,
+                shape=self._shape,
+                display_name=self._display_name,
+                source_details=self._source_details,
                 create_vnic_details=oci.core.models.CreateVnicDetails(
-                    subnet_id=self.config.get('OCI', 'subnet_id').strip(),
-                    assign_public_ip=assign_public_ip
+                    subnet_id=self._subnet_id,
+                    assign_public_ip=self._assign_public_ip
                 )
             )
             
-            # Add shape configuration for flexible shapes
-            if "Flex" in self.config.get('Machine', 'shape'):
-                ocpus = float(self.config.get('Machine', 'ocpus'))
-                memory = float(self.config.get('Machine', 'memory'))
-                
-                # Validate ARM limits
-                machine_type = self.config.get('Machine', 'type').upper()
-                if machine_type == 'ARM':
-                    if ocpus > 4:
-                        logging.warning(f"OCPUs {ocpus} exceeds ARM limit of 4, setting to 4")
-                        ocpus = 4
-                    if memory > 24:
-                        logging.warning(f"Memory {memory}GB exceeds ARM limit of 24GB, setting to 24")
-                        memory = 24
-                    # ARM memory must be 6GB per OCPU
-                    expected_memory = ocpus * 6
-                    if memory != expected_memory:
-                        logging.warning(f"ARM memory should be {expected_memory}GB for {ocpus} OCPUs, adjusting")
-                        memory = expected_memory
-                
-                launch_details.shape_config = oci.core.models.LaunchInstanceShapeConfigDetails(
-                    ocpus=ocpus,
-                    memory_in_gbs=memory
-                )
-                
-                logging.debug(f"  Shape config: {ocpus} OCPUs, {memory}GB RAM")
+            # Add shape configuration for flexible shapes (validated once at startup)
+            if self._shape_config is not None:
+                launch_details.shape_config = self._shape_config
+                logging.debug("  Shape config: %s OCPUs, %sGB RAM", self._validated_ocpus, self._validated_memory)
             
             return launch_details
             
@@ -1350,75 +1833,198 @@ class OciOccFix:
 
     def get_source_details(self):
         """Get instance source configuration"""
-        try:
-            boot_volume_id = self.config.get('OCI', 'boot_volume_id')
-        except:
-            boot_volume_id = ''
-        
-        if boot_volume_id and boot_volume_id != 'xxxx':
+        if self._boot_volume_id and self._boot_volume_id != 'xxxx':
             return oci.core.models.InstanceSourceViaBootVolumeDetails(
                 source_type="bootVolume",
-                boot_volume_id=boot_volume_id
+                boot_volume_id=self._boot_volume_id
             )
         
-        try:
-            boot_volume_size = int(self.config.get('Instance', 'boot_volume_size'))
-        except:
-            boot_volume_size = 47
-        
         return oci.core.models.InstanceSourceViaImageDetails(
             source_type="image",
-            image_id=self.config.get('OCI', 'image_id'),
-            boot_volume_size_in_gbs=boot_volume_size
+            image_id=self._image_id,
+            boot_volume_size_in_gbs=self._boot_volume_size
         )
 
-    def adaptive_retry_wait(self):
-        """Adjust retry interval based on errors"""
-        try:
-            min_interval = float(self.config.get('Retry', 'min_interval'))
-        except:
-            min_interval = 1.0
-        
+    def running_instance_count(self) -> Optional[int]:
+        """Running instances in the compartment, refreshed every INSTANCE_COUNT_CACHE_TTL seconds"""
+        bucket = int(time.time() // INSTANCE_COUNT_CACHE_TTL)
+        cached = self._instance_count_cache
+        if cached is not None and cached[0] == bucket:
+            return cached[1]
         try:
-            max_interval = float(self.config.get('Retry', 'max_interval'))
-        except:
-            max_interval = 60.0
-        
+            count = len(oci.pagination.list_call_get_all_results(
+                self.clients['compute'].list_instances,
+                compartment_id=self._compartment_id,
+                lifecycle_state='RUNNING'
+            ).data)
+        except Exception as e:
+            logging.warning(f"Failed to list running instances: {str(e)}")
+            return None
+        self._instance_count_cache = (bucket, count)
+        return count
+
+    def next_wait(self) -> float:
+        """Capped exponential backoff with full jitter"""
+        base = self.initial_wait * self.backoff_factor ** self.retry_counter
+        if self._sweep_throttled:
+            base *= TOO_MANY_REQUESTS_MULTIPLIER
+        base = min(max(base, self.min_interval), self.max_interval)
+        self.wait_seconds = random.uniform(self.min_interval, base)
+        return self.wait_seconds
+
+    def cool_down_ad(self, availability_domain: str):
+        """Skip an AD for a while after it reports no capacity, doubling on every repeat"""
+        failures = self._ad_failures.get(availability_domain, 0) + 1
+        self._ad_failures[availability_domain] = failures
+        delay = min(self.min_interval * 2 ** min(failures - 1, MAX_BACKOFF_EXPONENT), AD_COOLDOWN_MAX)
+        self._ad_cooldowns[availability_domain] = time.monotonic() + delay
+
+    def ready_ads(self, ads: List[str]) -> List[str]:
+        """ADs whose cooldown has expired; never empty, so every sweep tries at least one AD"""
+        now = time.monotonic()
+        ready = [ad for ad in ads if self._ad_cooldowns.get(ad, 0) <= now]
+        return ready or [min(ads, key=lambda ad: self._ad_cooldowns.get(ad, 0))]
+
+    def attempt_sweep(self, ads: List[str]) -> List[str]:
+        """Try every AD concurrently; return the IDs of all instances the sweep created"""
+        # launch_instance is blocking I/O, so the pool overlaps the per-AD round-trips
+        futures = [self.ad_pool.submit(self.create_instance, ad) for ad in ads]
+        created = []
+        alerts = []
         try:
-            backoff_factor = float(self.config.get('Retry', 'backoff_factor'))
-        except:
-            backoff_factor = 1.5
-        
-        if self.last_error_code == 'TooManyRequests':
-            self.wait_seconds = min(self.wait_seconds * backoff_factor, max_interval)
-        else:
-            self.wait_seconds = max(self.wait_seconds / 1.2, min_interval)
-        
-        self.wait_seconds = max(min(self.wait_seconds, max_interval), min_interval)
+            # Launches already in flight cannot be recalled, so every attempt is awaited
+            # even after a success; they may have created instances too
+            for future in as_completed(futures, timeout=max(self.wait_seconds * 2, SWEEP_TIMEOUT_FLOOR)):
+                if future.cancelled():
+                    continue
+                instance_id, alert = future.result()
+                if instance_id:
+                    if not created:
+                        # Attempts that have not started yet are no longer needed
+                        for pending in futures:
+                            pending.cancel()
+                    created.append(instance_id)
+                elif alert:
+                    alerts.append(alert)
+        except FuturesTimeoutError:
+            logging.warning("Availability domain attempts timed out, continuing with the next sweep")
+        
+        # A sibling's quota error is expected once one launch went through
+        if not created:
+            for alert in alerts:
+                self.send_telegram_message(alert)
+        return created
+
+    def announce_success(self, instance_ids: List[str]):
+        """Log and notify every instance created by the finishing run"""
+        ids_text = ', '.join(instance_ids)
+        logging.info(f"✅ Success! Instance(s) created: {ids_text}")
+        self.add_dashboard_log('INFO', f"SUCCESS! Instance(s) created: {ids_text}")
+        if len(instance_ids) > 1:
+            logging.warning(f"Concurrent attempts created {len(instance_ids)} instances: {ids_text}")
+        
+        # TELEGRAM BAŞARI BİLDİRİMİ - YENİ EKLENDİ
+        self.send_telegram_message(TG_SUCCESS_TEMPLATE.format_map({
+            'instances': '\n'.join(
+                f"• Instance ID: <code>{instance_id}</code> ({self._instance_ads.get(instance_id, 'N/A')})"
+                for instance_id in instance_ids
+            ),
+            'shape': self._shape,
+            'display_name': self._display_name,
+            'total_attempts': self.total_retries,
+            'elapsed': datetime.timedelta(seconds=self.uptime_seconds()) if self.start_time else 'N/A',
+            'extra_note': TG_EXTRA_INSTANCES_NOTE.format(count=len(instance_ids)) if len(instance_ids) > 1 else ''
+        }))
+
+    def start(self) -> bool:
+        """Queue a run on the control thread; False if one is running or already queued"""
+        with self._control_lock:
+            if self.is_running or self._start_pending:
+                return False
+            self._start_pending = True
+            if self._control_thread is None or not self._control_thread.is_alive():
+                self._control_thread = threading.Thread(target=self._control_worker, name='oci-bot', daemon=True)
+                self._control_thread.start()
+        self._control_queue.put('start')
+        return True
+
+    def _control_worker(self):
+        """Run the retry loop for each queued start, one run at a time"""
+        while True:
+            self._control_queue.get()
+            with self._control_lock:
+                if not self._start_pending:
+                    # Cancelled by stop() before it got here
+                    continue
+                self._start_pending = False
+                # Armed under the lock, so a stop() from here on is never overwritten
+                self.is_running = True
+                self._stop_event.clear()
+            try:
+                self.run()
+            except Exception as e:
+                # The thread must outlive a failed run, or later starts are never picked up
+                logging.error(f"Bot run failed: {str(e)}")
+                self.add_dashboard_log('ERROR', f"Bot run failed: {str(e)}")
+                self.update_dashboard(bot_status='stopped')
+            finally:
+                self.is_running = False
+
+    def stop(self):
+        """Stop the retry loop, interrupting its wait between sweeps"""
+        with self._control_lock:
+            self.is_running = False
+            self._start_pending = False
+        self._stop_event.set()
+        self.update_dashboard(bot_status='stopped')
 
     def run(self):
         """Main execution loop"""
+        # Callers arm is_running (and the stop event) before calling, so a stop
+        # requested while the run is starting up is not lost
         logging.info("Starting OCI instance creation bot...")
-        self.is_running = True
+        
+        # Validate before announcing the start so a failed start never shows as running
+        ads = self._ads
+        if ads is None:
+            logging.critical("Invalid availability_domains format")
+            self.send_telegram_message("❌ Bot failed to start: Invalid availability_domains format")
+            self.update_dashboard(bot_status='stopped')
+            return
+        
+        if not ads:
+            logging.critical("No availability domains configured")
+            self.send_telegram_message("❌ Bot failed to start: No availability domains configured")
+            self.update_dashboard(bot_status='stopped')
+            return
+        
+        # Launch requests only differ by AD, so build them once per run. Each AD
+        # gets its own model because the sweep launches them concurrently.
+        try:
+            self._source_details = self.get_source_details()
+            self._launch_details = {ad: self.build_launch_details(ad) for ad in ads}
+        except Exception as e:
+            logging.critical(f"Invalid launch configuration: {str(e)}")
+            self.send_telegram_message(f"❌ Bot failed to start: {str(e)}")
+            self.update_dashboard(bot_status='stopped')
+            return
+        
         self.start_time = datetime.datetime.now()
+        self._start_monotonic = time.monotonic()
         
         # TELEGRAM BAŞLANGIÇ BİLDİRİMİ - YENİ EKLENDİ
-        startup_message = f"""
-🚀 <b>Bot Started!</b>
-
-⚙️ <b>Configuration:</b>
-• Region: {self.config.get('DEFAULT', 'region')}
-• Shape: {self.config.get('Machine', 'shape')}
-• Type: {self.config.get('Machine', 'type')}
-• OCPUs: {self.config.get('Machine', 'ocpus')}
-• Memory: {self.config.get('Machine', 'memory')} GB
-• Display Name: {self.config.get('Instance', 'display_name')}
-
-📍 <b>Availability Domains:</b>
-{chr(10).join(['• ' + ad for ad in json.loads(self.config.get('OCI', 'availability_domains'))])}
-
-⏰ Started at: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}
-"""
+        # Raw INI text, as typed by the user, rather than the parsed values
+        machine = self._safe_config['machine']
+        startup_message = TG_STARTUP_TEMPLATE.format_map({
+            'region': self._safe_config['region'],
+            'shape': machine['shape'],
+            'machine_type': machine['type'],
+            'ocpus': machine['ocpus'],
+            'memory': machine['memory'],
+            'display_name': self._safe_config['instance']['display_name'],
+            'availability_domains': '\n'.join('• ' + ad for ad in ads),
+            'started_at': self.start_time.strftime('%Y-%m-%d %H:%M:%S')
+        })
         self.send_telegram_message(startup_message)
         
         self.update_dashboard(
@@ -1426,55 +2032,67 @@ class OciOccFix:
             start_time=self.start_time.isoformat()
         )
         
-        try:
-            ads = json.loads(self.config.get('OCI', 'availability_domains'))
-        except json.JSONDecodeError:
-            logging.critical("Invalid availability_domains format")
-            self.send_telegram_message("❌ Bot failed to start: Invalid availability_domains format")
-            return
-        
         consecutive_errors = 0
-        try:
-            max_consecutive_errors = int(self.config.get('Retry', 'max_consecutive_errors'))
-        except:
-            max_consecutive_errors = 10
+        self.retry_counter = 0
+        
+        # One worker per AD, reused by every sweep of this run
+        self.ad_pool = ThreadPoolExecutor(max_workers=len(ads), thread_name_prefix='ad-try')
+        self._run_created.clear()
+        self._ad_cooldowns.clear()
+        self._ad_failures.clear()
         
         while self.is_running:
             try:
-                for ad in ads:
-                    if not self.is_running:
-                        break
-                        
-                    self.total_retries += 1
-                    
-                    # TELEGRAM PERİYODİK GÜNCELLEME - YENİ EKLENDİ
-                    self.send_periodic_update()
-                    
-                    self.update_dashboard(
-                        total_attempts=self.total_retries,
-                        last_attempt_time=datetime.datetime.now().isoformat()
-                    )
-                    
-                    instance_id = self.create_instance(ad)
-                    
-                    if instance_id:
-                        consecutive_errors = 0
-                        logging.info(f"✅ Success! Instance created: {instance_id}")
-                        self.add_dashboard_log('INFO', f"SUCCESS! Instance created: {instance_id}")
+                # Skip the launch round-trips entirely once the target is already running
+                if self.target_count:
+                    running = self.running_instance_count()
+                    if running is not None and running >= self.target_count:
+                        logging.info(f"✅ {running} instance(s) already running, target of {self.target_count} reached")
+                        self.add_dashboard_log('INFO', f"Target reached: {running} instance(s) running")
                         self.update_dashboard(bot_status='stopped')
                         self.is_running = False
                         break
-                    else:
-                        consecutive_errors += 1
-                    
-                    if consecutive_errors >= max_consecutive_errors:
-                        self.adaptive_retry_wait()
-                        consecutive_errors = 0
-                    
-                    time.sleep(self.wait_seconds)
-                    
-                    if self.total_retries % 5 == 0:
-                        self.adaptive_retry_wait()
+                
+                sweep_ads = self.ready_ads(ads)
+                previous_retries = self.total_retries
+                self.total_retries += len(sweep_ads)
+                
+                # TELEGRAM PERİYODİK GÜNCELLEME - YENİ EKLENDİ
+                # Only when this sweep crossed an update_interval boundary
+                if self.total_retries // self.update_interval > previous_retries // self.update_interval:
+                    self.send_periodic_update()
+                
+                self.update_dashboard(
+                    total_attempts=self.total_retries,
+                    last_attempt_time=datetime.datetime.now().isoformat()
+                )
+                
+                self._sweep_throttled = False
+                self.attempt_sweep(sweep_ads)
+                
+                # Includes attempts left running by an earlier timed-out sweep that succeeded since
+                if self._run_created:
+                    with dashboard_lock:
+                        created = list(self._run_created)
+                    consecutive_errors = 0
+                    self.retry_counter = 0
+                    self.announce_success(created)
+                    self.update_dashboard(bot_status='stopped')
+                    self.is_running = False
+                    break
+                
+                # Only throttling grows the backoff; capacity errors are the normal
+                # state and keep retrying at the base pace
+                if self._sweep_throttled:
+                    consecutive_errors += len(sweep_ads)
+                    if consecutive_errors >= self.max_consecutive_errors and self.retry_counter < MAX_BACKOFF_EXPONENT:
+                        self.retry_counter += 1
+                else:
+                    consecutive_errors = 0
+                    self.retry_counter = 0
+                
+                if self._stop_event.wait(self.next_wait()):
+                    break
                 
             except KeyboardInterrupt:
                 logging.info("Process interrupted by user")
@@ -1484,17 +2102,16 @@ class OciOccFix:
             except Exception as e:
                 logging.error(f"Error in main loop: {str(e)}")
                 self.send_telegram_message(f"❌ Bot error: {str(e)}")
-                time.sleep(self.wait_seconds)
+                self._stop_event.wait(self.wait_seconds)
+        
+        self.ad_pool.shutdown(wait=False)
         
         # TELEGRAM SONLANMA BİLDİRİMİ - YENİ EKLENDİ
-        final_message = f"""
-🛑 <b>Bot Stopped</b>
-
-📊 Final Statistics:
-• Total Attempts: {self.total_retries}
-• Instances Created: {len(self.instances_created)}
-• Runtime: {datetime.datetime.now() - self.start_time if self.start_time else 'N/A'}
-"""
+        final_message = TG_STOPPED_TEMPLATE.format_map({
+            'total_attempts': self.total_retries,
+            'instances_created': len(self.instances_created),
+            'runtime': datetime.timedelta(seconds=self.uptime_seconds()) if self.start_time else 'N/A'
+        })
         self.send_telegram_message(final_message)
         
         self.update_dashboard(bot_status='stopped')
@@ -1505,8 +2122,10 @@ def main():
         bot = OciOccFix()
         
         # If dashboard is disabled, run bot directly
-        if not FLASK_AVAILABLE or not bot.config.getboolean('Dashboard', 'enabled', fallback=False):
+        if not FLASK_AVAILABLE or not bot.dashboard_enabled:
+            bot.is_running = True
             bot.run()
+            bot.close_telegram()
         else:
             # Keep main thread alive while dashboard runs
             print("\n✅ Bot initialized. Use web dashboard to control.")